@@ -1,34 +1,120 @@
+import re
 import json
 import os
+import hashlib
 import asyncio
-import random
+import logging
+import threading
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin, urlparse
-from playwright.async_api import async_playwright
-from playwright_stealth import Stealth
-from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library json module
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; without it every page is loaded with Playwright
+    httpx = None
 
 from scrapers.table import TableScraper
 from scrapers.link import LinkScraper
+from scrapers.utils import parse_html
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Chromium launch flags for the shared browser
+CHROMIUM_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-ipc-flooding-protection',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-default-apps',
+    '--disable-popup-blocking',
+)
+
+# Jumps to the bottom until the page stops growing (at most 20 rounds), then returns to the top
+SCROLL_THROUGH_PAGE_JS = """async () => {
+    let lastHeight = -1;
+    for (let round = 0; round < 20 && document.body.scrollHeight !== lastHeight; round++) {
+        lastHeight = document.body.scrollHeight;
+        window.scrollTo(0, lastHeight);
+        await new Promise(resolve => setTimeout(resolve, 300));
+    }
+    window.scrollTo(0, 0);
+}"""
+
+# Subresources the scrapers never look at; aborting them keeps page loads and networkidle short
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+# Analytics and ad hosts (and their subdomains) whose beacons keep networkidle from settling
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'hotjar.com')
+
+# Iframe markup in raw HTML; its content is only there once Playwright loads the page
+IFRAME_TAG_RE = re.compile(r'<iframe\b', re.IGNORECASE)
+
+# Table or row markup in page HTML; TableScraper has nothing to parse without it
+TABLE_MARKUP_RE = re.compile(r'<t(?:able|r)\b', re.IGNORECASE)
+
+# URL schemes that never point at a page worth loading
+NON_FETCHABLE_SCHEMES = ('data:', 'about:', 'javascript:', 'mailto:')
+
+# Maximum number of pages (base URLs and iframes) loading at once on the shared browser
+MAX_PARALLEL_PAGES = 4
+
+# Deepest level of nested cross-origin iframes that is loaded (the page itself is level 0)
+MAX_IFRAME_DEPTH = 2
+
+# Workers loading a single page's iframe tree
+IFRAME_WORKERS = 3
 
 
 class MeetingScraper:
-    def __init__(self, config: Dict[str, Any], headless: bool = True, debug_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], headless: bool = True, debug_mode: bool = False,
+                 writer: Optional["ResultWriter"] = None):
         self.config = config
         self.headless = headless
         self.debug_mode = debug_mode
+        self.writer = writer
         self.results = []
         
+        # Playwright driver and browser shared by every page of the run
+        self._playwright = None
+        self._browser = None
+        self._page_pool: Optional[asyncio.Queue] = None
+        # Held while the browser starts, so concurrent first loads share one launch
+        self._browser_lock = asyncio.Lock()
+        
+        # Plain HTTP client for server-rendered pages, and hosts known to need a browser
+        self._http_client = None
+        self._js_hosts = set()
+        
+        # Single-page loads keyed by absolute URL; None marks a URL that failed to load this run
+        self._page_cache: Dict[str, Optional[Tuple[str, List[Tuple[str, str]]]]] = {}
+        
         # Create debug directory and log file
         self.debug_dir = Path("debug")
         self.debug_dir.mkdir(exist_ok=True)
         self.debug_log = self.debug_dir / "logs.log"
         
-        # Initialize debug log
+        # Initialize debug log and keep a buffered handle open for the run
         self._init_debug_log()
+        self._log_fh = open(self.debug_log, 'a', buffering=8192, encoding='utf-8')
+        self._log_buf: List[str] = []
+        # Scraper threads queue messages while the event loop flushes them
+        self._log_lock = threading.Lock()
     
     def _init_debug_log(self):
         """Initialize debug log file."""
@@ -41,213 +127,390 @@ class MeetingScraper:
             f.write(f"Timestamp: {datetime.now().isoformat()}\n\n")
     
     def _log_debug(self, message: str):
-        """Write debug message to log file."""
-        with open(self.debug_log, 'a', encoding='utf-8') as f:
-            f.write(f"{datetime.now().isoformat()} - {message}\n")
+        """Queue debug message for the log file; written out by _flush_log."""
+        line = f"{datetime.now().isoformat()} - {message}\n"
+        with self._log_lock:
+            self._log_buf.append(line)
     
-    async def _load_page_with_playwright(self, url: str, depth: int = 0) -> Optional[str]:
-        """Load page content using Playwright with stealth mode."""
-        if depth > 2:  # Prevent infinite recursion
-            return None
-
-        stealth = Stealth(
-            navigator_languages_override=("en-US", "en"),
-            navigator_platform="Win32",
-            init_scripts_only=True
-        )
+    def _flush_log(self):
+        """Write all queued debug messages to the log file in one call."""
+        with self._log_lock:
+            buf, self._log_buf = self._log_buf, []
+        if buf:
+            self._log_fh.write(''.join(buf))
+    
+    def close(self):
+        """Flush and close the debug log file."""
+        if not self._log_fh.closed:
+            self._flush_log()
+            self._log_fh.close()
+    
+    async def _ensure_browser(self):
+        """Start Playwright and launch the shared Chromium instance on first use.
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-ipc-flooding-protection',
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-default-apps',
-                    '--disable-popup-blocking'
-                ]
-            )
+        Only called when a page needs a browser, so runs served entirely over HTTP never start one.
+        """
+        async with self._browser_lock:
+            if self._page_pool is not None:
+                return self._browser
+            
+            # Imported here so loading this module (e.g. for load_config) doesn't pull in Playwright
+            from playwright.async_api import async_playwright
             
             try:
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    permissions=['geolocation'],
-                    accept_downloads=False,
-                    java_script_enabled=True,
-                    ignore_https_errors=True
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    args=list(CHROMIUM_ARGS)
                 )
                 
-                await context.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0'
-                })
-                
-                page = await context.new_page()
-                await page.set_viewport_size({"width": 1920, "height": 1080})
-                
-                # Navigate to URL
-                await page.goto(url, timeout=45000, wait_until='domcontentloaded')
-                
-                # Apply stealth mode AFTER navigation
-                await stealth.apply_stealth_async(page)
-                
-                # Wait for either tr elements or timeout
-                try:
-                    await page.wait_for_selector('tr', timeout=15000)
-                except:
-                    pass
-                
-                # Wait for page to be more stable
-                await page.wait_for_load_state('domcontentloaded', timeout=10000)
-                
-                # Smart scrolling to trigger lazy loading
+                # Fill the pool with ready pages; taking one from the queue also caps concurrent loads
+                page_pool = asyncio.Queue()
+                pages = await asyncio.gather(*(self._new_pooled_page() for _ in range(MAX_PARALLEL_PAGES)))
+                for page in pages:
+                    page_pool.put_nowait(page)
+            except Exception:
+                # Leave nothing half-started, so the next page load can try again
+                await self._close_browser()
+                raise
+            self._page_pool = page_pool
+            return self._browser
+    
+    async def _new_pooled_page(self):
+        """Create a stealth context with one page, set up once and reused for many URLs."""
+        context = await self._browser.new_context(
+            user_agent=USER_AGENT,
+            locale='en-US',
+            timezone_id='America/New_York',
+            permissions=['geolocation'],
+            accept_downloads=False,
+            java_script_enabled=True,
+            ignore_https_errors=True
+        )
+        
+        await context.set_extra_http_headers({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1',
+            'Cache-Control': 'max-age=0'
+        })
+        
+        # Register stealth init scripts on the context so they run before any page script
+        await _get_stealth().apply_stealth_async(context)
+        
+        await context.route("**/*", _block_unneeded_resources)
+        
+        page = await context.new_page()
+        await page.set_viewport_size({"width": 1920, "height": 1080})
+        return page
+    
+    async def aclose(self):
+        """Close the shared browser, stop Playwright and close the HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        await self._close_browser()
+    
+    async def _close_browser(self):
+        """Close the shared browser, if started, and stop Playwright."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+            self._page_pool = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def _load_page_with_playwright(self, url: str) -> Optional[str]:
+        """Load a page and its cross-origin iframes, returning the merged HTML.
+        
+        Iframes are loaded breadth-first from a work queue by a fixed pool of
+        workers, so the number of pages in use does not grow with iframe depth.
+        """
+        loaded: Dict[str, Optional[Tuple[str, List[Tuple[str, str]]]]] = {}
+        seen = {url}
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait((url, 0))
+        
+        workers = [
+            asyncio.create_task(self._drain_iframe_queue(queue, seen, loaded))
+            for _ in range(IFRAME_WORKERS)
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        return self._assemble_page(url, loaded, set())
+    
+    async def _drain_iframe_queue(self, queue: asyncio.Queue, seen: set,
+                                  loaded: Dict[str, Optional[Tuple[str, List[Tuple[str, str]]]]]) -> None:
+        """Worker: load queued (url, depth) pages and queue their cross-origin iframes."""
+        while True:
+            page_url, depth = await queue.get()
+            try:
+                page_data = await self._load_single_page(page_url)
+                loaded[page_url] = page_data
+                if page_data is not None and depth < MAX_IFRAME_DEPTH:
+                    for kind, value in page_data[1]:
+                        if kind == 'url' and value not in seen:
+                            seen.add(value)
+                            queue.put_nowait((value, depth + 1))
+            finally:
+                queue.task_done()
+    
+    def _assemble_page(self, url: str, loaded: Dict[str, Optional[Tuple[str, List[Tuple[str, str]]]]],
+                       ancestors: set) -> Optional[str]:
+        """Merge a loaded page with the HTML of its iframes, in document order."""
+        page_data = loaded.get(url)
+        if page_data is None:
+            return None
+        
+        content, iframe_parts = page_data
+        fragments = []
+        for kind, value in iframe_parts:
+            if kind == 'html':
+                fragments.append(value)
+            elif value not in ancestors:  # Skip frames that embed one of their own parents
+                iframe_page_content = self._assemble_page(value, loaded, ancestors | {url})
+                if iframe_page_content:
+                    fragments.append(f'\n<!-- iframe content from {value} -->\n<div class="iframe-content">\n{iframe_page_content}\n</div>\n<!-- end iframe content -->\n')
+        
+        if not fragments:
+            return content
+        
+        # Splice once before the closing body tag instead of rescanning with str.replace
+        body_end = content.rfind('</body>')
+        if body_end == -1:
+            body_end = len(content)
+        return ''.join([content[:body_end], ''.join(fragments), content[body_end:]])
+    
+    async def _load_single_page(self, url: str) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """Load one page on a pooled stealth page of the shared browser.
+        
+        Returns the page HTML and its iframes, each either ('html', fragment) when the
+        frame could be read in place or ('url', src) when it must be loaded separately.
+        """
+        # Reuse pages (including failures) already loaded during this run
+        if url in self._page_cache:
+            return self._page_cache[url]
+        
+        # A browser that fails to start fails this URL only; the next load tries again
+        try:
+            await self._ensure_browser()
+        except Exception as e:
+            print(f"Error starting browser for {url}: {e}")
+            return None
+        page = await self._page_pool.get()
+        page_ok = False
+        try:
+            # Navigate to URL
+            await page.goto(url, timeout=45000, wait_until='domcontentloaded')
+            
+            # Give JS-rendered tables a moment to appear; pages with only links don't wait long
+            try:
+                await page.wait_for_selector('tr', timeout=3000)
+            except:
+                pass
+            
+            # Scroll to the bottom inside the browser until lazy-loaded content stops arriving,
+            # with a single round trip, then wait for the network to settle
+            try:
+                await page.evaluate(SCROLL_THROUGH_PAGE_JS)
+                await page.wait_for_load_state('networkidle', timeout=5000)
+            except Exception:
+                pass
+            
+            # Wait for JS-rendered content to finish instead of sleeping a fixed time
+            try:
+                await page.wait_for_function("document.readyState === 'complete'", timeout=5000)
+            except Exception:
+                pass
+            
+            # Get page content
+            content = await page.content()
+            
+            # Save HTML content to a per-URL debug file, off the event loop, if debug mode is enabled
+            if self.debug_mode:
+                await asyncio.get_running_loop().run_in_executor(None, self._write_debug_html, url, content)
+            
+            # Read in-place iframes now; the page goes back to the pool before any others load
+            iframe_parts = await self._extract_iframe_content(page, url)
+            page_ok = True
+            
+            self._page_cache[url] = (content, iframe_parts)
+            return self._page_cache[url]
+            
+        except Exception as e:
+            print(f"Error loading {url}: {e}")
+            self._page_cache[url] = None
+            return None
+        finally:
+            # Replace the page after a failure, as it may be crashed or stuck mid-navigation
+            if not page_ok:
                 try:
-                    page_height = await page.evaluate("document.body.scrollHeight")
-                    viewport_height = 1080
-                    
-                    for i in range(0, page_height, viewport_height // 2):
-                        await page.evaluate(f"window.scrollTo(0, {i})")
-                        await asyncio.sleep(random.uniform(0.5, 1.0))
-                    
-                    await page.evaluate("window.scrollTo(0, 0)")
-                    await asyncio.sleep(random.uniform(0.5, 1.0))
+                    await page.context.close()
+                    page = await self._new_pooled_page()
                 except Exception:
                     pass
-                
-                # Additional wait for JS-rendered content
-                await asyncio.sleep(random.uniform(1.5, 2.5))
-                
-                # Get page content
-                content = await page.content()
-                
-                # Save HTML content to debug file if debug mode is enabled
-                if self.debug_mode:
-                    with open(self.debug_dir / "element.html", 'w', encoding='utf-8') as f:
-                        f.write(content)
-                
-                # Extract iframe content and merge with main content
-                iframe_content = await self._extract_iframe_content(page, url, depth)
-                if iframe_content:
-                    content = content.replace('</body>', iframe_content + '</body>')
-                
-                return content
-                
-            except Exception as e:
-                print(f"Error loading {url}: {e}")
-                return None
-            finally:
-                await browser.close()
+            self._page_pool.put_nowait(page)
     
-    async def _extract_iframe_content(self, page, base_url: str, depth: int = 0) -> str:
-        """Extract content from iframes and return as HTML string."""
-        iframe_content = ""
-        
+    def _write_debug_html(self, url: str, content: str) -> None:
+        """Write a loaded page's HTML to debug/element_<url hash>.html."""
+        digest = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
+        with open(self.debug_dir / f"element_{digest}.html", 'w', encoding='utf-8') as f:
+            f.write(f"<!-- {url} -->\n")
+            f.write(content)
+    
+    async def _extract_iframe_content(self, page, base_url: str) -> List[Tuple[str, str]]:
+        """Collect the page's iframes concurrently, in document order."""
         try:
             # Get all iframe elements from the page
             iframe_elements = await page.locator('iframe').all()
-            
-            for iframe_element in iframe_elements:
-                try:
-                    # Get the src attribute from the iframe element
-                    frame_url = await iframe_element.get_attribute('src')
-                    
-                    if frame_url:
-                        # Normalize URL if relative
-                        normalized_url = self._normalize_url(frame_url, base_url)
-                        # Load the iframe URL content with increased depth
-                        iframe_page_content = await self._load_page_with_playwright(normalized_url, depth + 1)
-                        if iframe_page_content:
-                            iframe_content += f'\n<!-- iframe content from {normalized_url} -->\n<div class="iframe-content">\n{iframe_page_content}\n</div>\n<!-- end iframe content -->\n'
-                    else:
-                        # If no src, try to get frame content directly (same-origin only)
-                        try:
-                            frame = await iframe_element.content_frame()
-                            if frame:
-                                frame_html = await frame.content()
-                                if frame_html:
-                                    iframe_content += f'\n<!-- iframe content -->\n<div class="iframe-content">\n{frame_html}\n</div>\n<!-- end iframe content -->\n'
-                        except Exception:
-                            # Cross-origin frame, skip if no src available
-                            pass
-                            
-                except Exception as e:
-                    print(f"Could not extract iframe content: {e}")
-                    continue
-                        
         except Exception as e:
             print(f"Error extracting iframe content: {e}")
+            return []
         
-        return iframe_content
+        # Origin the page actually ended up on, which differs from base_url after a cross-host redirect
+        page_netloc = urlparse(page.url).netloc
+        parts = await asyncio.gather(
+            *[self._extract_one_iframe(iframe_element, base_url, page_netloc) for iframe_element in iframe_elements],
+            return_exceptions=True
+        )
+        
+        iframe_parts = []
+        for part in parts:
+            if isinstance(part, Exception):
+                print(f"Could not extract iframe content: {part}")
+            elif part:
+                iframe_parts.append(part)
+        
+        return iframe_parts
+    
+    async def _extract_one_iframe(self, iframe_element, base_url: str, page_netloc: str) -> Optional[Tuple[str, str]]:
+        """Read a single iframe in place, or return its URL when it needs its own page load."""
+        # Get the src attribute from the iframe element
+        frame_url = await iframe_element.get_attribute('src')
+        
+        # Frame already attached to this page, if Playwright can reach it
+        try:
+            frame_handle = await iframe_element.element_handle()
+            frame = await frame_handle.content_frame()
+        except Exception:
+            frame = None
+        
+        # Normalize URL if relative; about:blank, data: and similar sources normalize to ""
+        normalized_url = self._normalize_url(frame_url, base_url) if frame_url else ""
+        
+        if normalized_url:
+            # Same-origin frames are already loaded, read their DOM without navigating again. Frames
+            # with iframes of their own are loaded as a page instead, so the nested iframes get loaded too.
+            if frame and not frame.child_frames and urlparse(frame.url).netloc == page_netloc:
+                try:
+                    frame_html = await frame.content()
+                except Exception:
+                    # Frame detached or navigated mid-read; load it as its own page instead
+                    return ('url', normalized_url)
+                if frame_html:
+                    return ('html', f'\n<!-- iframe content from {normalized_url} -->\n<div class="iframe-content">\n{frame_html}\n</div>\n<!-- end iframe content -->\n')
+                return None
+            
+            # Other iframes are queued and loaded on their own pooled page
+            return ('url', normalized_url)
+        
+        # If no loadable src, try to get frame content directly (same-origin only)
+        try:
+            if frame:
+                frame_html = await frame.content()
+                if frame_html:
+                    return ('html', f'\n<!-- iframe content -->\n<div class="iframe-content">\n{frame_html}\n</div>\n<!-- end iframe content -->\n')
+        except Exception:
+            # Cross-origin frame, skip if no src available
+            pass
+        return None
     
     def _normalize_url(self, url: str, base_url: str) -> str:
         """Normalize URL - convert relative URLs to absolute."""
         if not url:
             return ""
         
+        # Inline and pseudo URLs have nothing to load
+        if url[:11].lower().startswith(NON_FETCHABLE_SCHEMES):
+            return ""
+        
         # If it's already an absolute URL, return as is
-        if url.startswith(('http://', 'https://')):
+        if '://' in url[:8]:
             return url
         
         # If it's a relative URL starting with /, combine with base URL origin
         if url.startswith('/'):
-            parsed_base = urlparse(base_url)
+            parsed_base = _parse_base(base_url)
             return f"{parsed_base.scheme}://{parsed_base.netloc}{url}"
         
         # Otherwise, use urljoin to handle relative paths
         return urljoin(base_url, url)
     
-    async def _scrape_url(self, url: str) -> List[Dict[str, Any]]:
-        """Try different scraper modules for a URL until one succeeds."""
-        start_date = self.config["start_date"]
-        end_date = self.config["end_date"]
+    async def _fetch_http(self, url: str) -> Optional[str]:
+        """Fetch page HTML with a plain HTTP GET, without running any JavaScript."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=15,
+                follow_redirects=True,
+                headers={
+                    'User-Agent': USER_AGENT,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9'
+                }
+            )
         
-        self._log_debug(f"[*] Processing URL: {url}")
-        print("Processing URL: ", url)
-        # Load page content using Playwright
         try:
-            html_content = await self._load_page_with_playwright(url)
-            if html_content is None:
-                self._log_debug(f"[!] Failed to load page content for {url}")
-                return []
+            response = await self._http_client.get(url)
+            if response.status_code != 200 or 'html' not in response.headers.get('content-type', ''):
+                return None
+            return response.text
         except Exception as e:
-            self._log_debug(f"[!] Playwright failed for {url}: {str(e)}")
-            return []
+            self._log_debug(f"[!] HTTP fetch failed for {url}: {str(e)}")
+            return None
+    
+    def _try_scrapers(self, html_content: str, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Run the scraper modules over page HTML until one succeeds."""
+        start_date = self.config["start_date"]
+        end_date = self.config["end_date"]
         
-        # Try table scraper first
-        try:
-            self._log_debug(f"[*] Trying TableScraper for {url}")
-            result = TableScraper.try_scrape(html_content, url, start_date, end_date)
-            if result is not None:
-                self._log_debug(f"[+] TableScraper succeeded for {url}")
-                return result
-            else:
-                self._log_debug(f"[-] TableScraper returned None for {url}")
-        except Exception as e:
-            self._log_debug(f"[!] TableScraper failed for {url}: {str(e)}")
+        # Parse the page once with lxml; both scrapers read the same tree
+        tree = parse_html(html_content)
+        if tree is None:
+            self._log_debug(f"[-] No parsable HTML for {url}")
+            return None
+        
+        # Try table scraper first, unless the page has no table markup for it to parse
+        if TABLE_MARKUP_RE.search(html_content):
+            try:
+                self._log_debug(f"[*] Trying TableScraper for {url}")
+                result = TableScraper.try_scrape(html_content, url, start_date, end_date, tree=tree)
+                if result is not None:
+                    self._log_debug(f"[+] TableScraper succeeded for {url}")
+                    return result
+                else:
+                    self._log_debug(f"[-] TableScraper returned None for {url}")
+            except Exception as e:
+                self._log_debug(f"[!] TableScraper failed for {url}: {str(e)}")
+        else:
+            self._log_debug(f"[-] No table markup, skipping TableScraper for {url}")
         
         # Try Link scraper if table scraper failed
         try:
             self._log_debug(f"[*] Trying LinkScraper for {url}")
-            result = LinkScraper.try_scrape(html_content, url, start_date, end_date)
+            result = LinkScraper.try_scrape(html_content, url, start_date, end_date, tree=tree)
             if result is not None:
                 self._log_debug(f"[+] LinkScraper succeeded for {url}")
                 return result
@@ -256,39 +519,197 @@ class MeetingScraper:
         except Exception as e:
             self._log_debug(f"[!] LinkScraper failed for {url}: {str(e)}")
         
+        return None
+    
+    async def _run_scrapers(self, html_content: str, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Run _try_scrapers in a worker thread.
+        
+        Parsing and the scrapers' blocking link checks would otherwise stall the event
+        loop, and with it every other page that is loading concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._try_scrapers, html_content, url)
+    
+    async def _scrape_url(self, url: str) -> List[Dict[str, Any]]:
+        """Try different scraper modules for a URL until one succeeds."""
+        self._log_debug(f"[*] Processing URL: {url}")
+        print("Processing URL: ", url)
+        
+        # Server-rendered pages don't need a browser, so try a plain HTTP fetch first
+        host = _parse_base(url).netloc
+        if httpx is not None and host not in self._js_hosts:
+            html_content = await self._fetch_http(url)
+            # Pages with iframes, or whose meetings are lazy-loaded, need the browser to show everything
+            if html_content and not IFRAME_TAG_RE.search(html_content):
+                result = await self._run_scrapers(html_content, url)
+                if result:
+                    return result
+            # Remember the host so its other URLs go straight to Playwright
+            self._js_hosts.add(host)
+            self._log_debug(f"[-] Raw HTML of {url} has iframes or no meetings, falling back to Playwright")
+        
+        # Load page content using Playwright
+        try:
+            html_content = await self._load_page_with_playwright(url)
+            if html_content is None:
+                self._log_debug(f"[!] Failed to load page content for {url}")
+                return []
+        except Exception as e:
+            self._log_debug(f"[!] Playwright failed for {url}: {str(e)}")
+            return []
+        
+        result = await self._run_scrapers(html_content, url)
+        if result is not None:
+            return result
+        
         self._log_debug(f"[-] All scrapers failed for {url}")
         return []
     
-    def scrape(self) -> List[Dict[str, Any]]:
-        """Main scraping method."""
-        for base_url in self.config["base_urls"]:
+    async def scrape_async(self) -> List[Dict[str, Any]]:
+        """Scrape all base URLs concurrently on a single shared browser.
+        
+        Results are kept in base URL order. When a result writer is attached, each
+        result is streamed to it as soon as it and every earlier URL have finished,
+        instead of being kept in memory.
+        """
+        # Results of URLs that finished ahead of an earlier URL, by position (None if no meetings)
+        finished: Dict[int, Optional[Dict[str, Any]]] = {}
+        next_index = 0
+        
+        async def scrape_and_record(index: int, base_url: str) -> None:
+            nonlocal next_index
+            meetings_data = await self._scrape_url(base_url)
             result = {
                 "base_url": base_url,
-                "meetings": []
+                "meetings": meetings_data
             }
             
-            meetings_data = asyncio.run(self._scrape_url(base_url))
-            result["meetings"] = meetings_data
-            
             if result["meetings"]:  # Only add if we found meetings
-                self.results.append(result)
+                finished[index] = result
                 self._log_debug(f"[+] Found {len(meetings_data)} meetings for {base_url}")
             else:
+                finished[index] = None
                 self._log_debug(f"[!] No meetings found for {base_url}")
+            
+            # Hand on every result whose earlier URLs are all done
+            while next_index in finished:
+                ready = finished.pop(next_index)
+                next_index += 1
+                if ready is None:
+                    continue
+                if self.writer is not None:
+                    self.writer.write(ready)
+                else:
+                    self.results.append(ready)
+            self._flush_log()
+        
+        # Drop repeated URLs, keeping the first occurrence's position
+        base_urls = list(dict.fromkeys(self.config["base_urls"]))
+        duplicate_count = len(self.config["base_urls"]) - len(base_urls)
+        if duplicate_count:
+            self._log_debug(f"[!] Skipping {duplicate_count} duplicate URLs")
+        
+        try:
+            await asyncio.gather(
+                *[scrape_and_record(index, base_url) for index, base_url in enumerate(base_urls)]
+            )
+        finally:
+            await self.aclose()
         
         return self.results
+    
+    def scrape(self) -> List[Dict[str, Any]]:
+        """Main scraping method."""
+        return asyncio.run(self.scrape_async())
+
+
+async def _block_unneeded_resources(route) -> None:
+    """Abort image, font, media, stylesheet and analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Check if a request goes to one of BLOCKED_HOSTS or a subdomain of one."""
+    host = urlsplit(url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS)
+
+
+@lru_cache(maxsize=None)
+def _get_stealth():
+    """Build the Stealth configuration once, on first use."""
+    from playwright_stealth import Stealth
+    
+    return Stealth(
+        navigator_languages_override=("en-US", "en"),
+        navigator_platform="Win32",
+        init_scripts_only=True
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_base(base_url: str):
+    """Parse a page URL once; every iframe on the page resolves against the same base."""
+    return urlparse(base_url)
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize obj as ASCII JSON with a two-space indent, exactly as json.dumps(obj, indent=2) does."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        # orjson writes non-ASCII characters and DEL raw where json escapes them as \uXXXX
+        if data.isascii() and b'\x7f' not in data:
+            return data
+    return json.dumps(obj, indent=2).encode('ascii')
+
+
+class ResultWriter:
+    """Stream results into a JSON array file one entry at a time."""
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.result_count = 0
+        self.meeting_count = 0
+        self._fh = open(file_path, 'wb', buffering=1 << 20)
+        self._fh.write(b'[')
+    
+    def write(self, result: Dict[str, Any]) -> None:
+        """Append one result, laid out as json.dump(results, indent=2) would."""
+        separator = b',' if self.result_count else b''
+        entry = _dumps_indented(result).replace(b'\n', b'\n  ')
+        self._fh.write(separator + b'\n  ' + entry)
+        # Flush so completed URLs survive an interrupted run
+        self._fh.flush()
+        self.result_count += 1
+        self.meeting_count += len(result.get('meetings', []))
+    
+    def close(self) -> None:
+        """Close the JSON array and the file."""
+        if self._fh.closed:
+            return
+        self._fh.write(b'\n]' if self.result_count else b']')
+        self._fh.close()
 
 
 def load_config(file_path: str) -> Dict[str, Any]:
     """Load configuration from a JSON file."""
-    with open(file_path, 'r') as f:
+    with open(file_path, 'rb') as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
         return json.load(f)
 
 
 def save_results(results: List[Dict[str, Any]], file_path: str) -> None:
     """Save results to a JSON file."""
-    with open(file_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    writer = ResultWriter(file_path)
+    try:
+        for result in results:
+            writer.write(result)
+    finally:
+        writer.close()
 
 
 def main():
@@ -298,26 +719,33 @@ def main():
     parser.add_argument('--head', action='store_true', 
                        help='Run with headless=False (show browser window)')
     parser.add_argument('--debug', action='store_true',
-                       help='Run in debug mode (saves HTML to debug/element.html)')
+                       help='Run in debug mode (saves each page HTML to debug/element_<hash>.html and logs scraper details)')
     args = parser.parse_args()
     
+    # Scraper warnings go to stderr; --debug also shows the scrapers' step-by-step messages
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(name)s: %(message)s')
+    if args.debug:
+        logging.getLogger('scrapers').setLevel(logging.DEBUG)
+    
     # Load configuration
     config = load_config('data/input.json')
     
     # Determine headless mode (default True, False if --head flag is provided)
     headless = not args.head
     
-    # Run the scraper
-    scraper = MeetingScraper(config, headless=headless, debug_mode=args.debug)
-    results = scraper.scrape()
-    
-    # Save results to output file
+    # Run the scraper, streaming each URL's results to the output file as it completes
     output_file = 'data/output.json'
-    save_results(results, output_file)
+    writer = ResultWriter(output_file)
+    scraper = MeetingScraper(config, headless=headless, debug_mode=args.debug, writer=writer)
+    try:
+        scraper.scrape()
+    finally:
+        writer.close()
+        scraper.close()
     
     print(f"\nScraping complete. Results saved to {output_file}")
     print(f"Total URLs processed: {len(config['base_urls'])}")
-    print(f"Total meetings found: {sum(len(result['meetings']) for result in results)}")
+    print(f"Total meetings found: {writer.meeting_count}")
     print(f"Headless mode: {headless}")
     print(f"Debug mode: {args.debug}")
 
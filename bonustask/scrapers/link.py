@@ -1,25 +1,106 @@
 import re
 import json
+import logging
 import requests
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from difflib import SequenceMatcher
+from urllib.parse import urljoin, urlparse, urlsplit
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import lxml.html
 from . import utils
 
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is optional; without it link checks are not cached between runs
+    CachedSession = None
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of link checks (HEAD/GET requests) in flight at once
+MAX_PARALLEL_CHECKS = 20
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# (session, stream session) pair built by _get_sessions on first use, so importing this module
+# doesn't open the requests-cache database
+_SESSIONS: Optional[Tuple[requests.Session, requests.Session]] = None
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_sessions() -> Tuple[requests.Session, requests.Session]:
+    """Return the shared (session, stream session) pair, creating it on first use.
+    
+    The session reuses pooled keep-alive connections for link checks; with requests-cache
+    installed it also keeps HEAD/GET responses on disk for a week across runs. Drive filename
+    lookups stream a GET of the whole file and only read its headers, so they use the stream
+    session, which is uncached but shares the same connection pool.
+    """
+    global _SESSIONS
+    # Link checks start from many threads at once; the lock makes them share one pair
+    with _SESSIONS_LOCK:
+        if _SESSIONS is None:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=MAX_PARALLEL_CHECKS,
+                                                    pool_maxsize=MAX_PARALLEL_CHECKS)
+            stream_session = requests.Session()
+            if CachedSession is not None:
+                session = CachedSession('.scraper_http_cache', backend='sqlite', allowable_methods=('GET', 'HEAD'),
+                                        expire_after=7 * 24 * 3600)
+            else:
+                session = stream_session
+            for each in (session, stream_session):
+                each.headers.update({'User-Agent': USER_AGENT})
+                each.mount('http://', adapter)
+                each.mount('https://', adapter)
+            _SESSIONS = (session, stream_session)
+        return _SESSIONS
+
+
+_DRIVE_FILE_ID_RE = re.compile(r"/file/d/([^/]+)/")
+_CD_FILENAME_RE = re.compile(r'filename="([^"]+)"')
+# youtube.com/watch?v= also covers m.youtube.com
+_YOUTUBE_RE = re.compile(r'youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/')
+_ZOOM_RECORDING_RE = re.compile(r"zoom\.us/rec/(?:share|play|download)/")
+_HYPHENS_RE = re.compile(r'-+')
+_PDF_EXT_RE = re.compile(r'\.pdf$')
+_FILENAME_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+# File suffixes of URLs that point straight at a video or PDF (str.endswith takes the whole tuple)
+_VIDEO_EXT_SUFFIXES = ('.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v')
+_MEDIA_EXT_SUFFIXES = ('.pdf',) + _VIDEO_EXT_SUFFIXES
+# (keyword, document type) pairs in priority order; "minute" also covers "meeting minutes"
+_DOCTYPE_KEYWORDS = (('minute', 'minutes'), ('agenda', 'agenda'), ('packet', 'packet'))
+
+# Page suffixes whose plain (query-less) URLs are ordinary web pages and are not worth a HEAD request
+_HTML_PAGE_SUFFIXES = ('.html', '.htm', '.aspx', '.php', '.jsp', '.cfm', '/')
+
+# Meeting keys that hold a document or video URL
+_MEDIA_KEYS = frozenset({'agenda', 'minutes', 'packet', 'unknown', 'video'})
+# Content types (without parameters) that mark a video response
+_VIDEO_CONTENT_TYPES = frozenset({
+    'video/mp4', 'video/quicktime', 'video/x-msvideo', 'video/x-ms-wmv',
+    'video/x-flv', 'video/webm', 'video/x-matroska', 'video/mpeg',
+    'video/3gpp', 'video/x-m4v'
+})
+
 class LinkScraper:
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_url(url: str, base_url: str) -> str:
         """Normalize URL - convert relative URLs to absolute."""
         return utils.normalize_url(url, base_url)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_date(date_str: str) -> Optional[str]:
         """Parse date string in various formats and return YYYY-MM-DD format."""
         return utils.parse_date(date_str)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_date_in_range(meeting_date: str, start_date: str, end_date: str) -> bool:
         """Check if meeting date is within the specified range."""
         if not meeting_date:
@@ -35,42 +116,7 @@ class LinkScraper:
             return True  # If date parsing fails, include by default
     
     @staticmethod
-    def _check_pdf_redirect(url: str) -> Optional[str]:
-        """Check if a URL redirects to a PDF and return the final PDF URL."""
-        try:
-            print(f"DEBUG: Checking redirect for: {url}")
-            response = requests.head(url, allow_redirects=True, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            print(f"DEBUG: Response status: {response.status_code}, final URL: {response.url}")
-            
-            # Check if the final URL ends with .pdf
-            final_url = response.url
-            if final_url.lower().endswith('.pdf'):
-                print(f"DEBUG: Found PDF redirect: {url} -> {final_url}")
-                return final_url
-                
-            return None
-        except Exception as e:
-            print(f"DEBUG: Error checking redirect for {url}: {e}")
-            return None
-    
-    @staticmethod
-    def _check_content_type_is_pdf(url: str) -> bool:
-        """Check if the content type of a URL is PDF."""
-        try:
-            response = requests.head(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            content_type = response.headers.get('content-type', '').lower()
-            return 'application/pdf' in content_type
-        except Exception as e:
-            print(f"Error checking content type for {url}: {e}")
-            return False
-    
-    @staticmethod
+    @lru_cache(maxsize=4096)
     def _get_google_drive_filename(view_url: str) -> Optional[str]:
         """
         Extract the real file name from a Google Drive link
@@ -78,7 +124,7 @@ class LinkScraper:
         """
         try:
             # Extract file ID
-            match = re.search(r"/file/d/([^/]+)/", view_url)
+            match = _DRIVE_FILE_ID_RE.search(view_url)
             if not match:
                 return None
             
@@ -87,10 +133,10 @@ class LinkScraper:
             # Convert to direct download URL
             download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
             
-            # Make request (follow redirects)
-            response = requests.get(download_url, allow_redirects=True, stream=True, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
+            # Make request (follow redirects); only the headers are read, so release the
+            # streamed connection back to the session pool right away
+            response = _get_sessions()[1].get(download_url, allow_redirects=True, stream=True, timeout=15)
+            response.close()
             
             # Get content disposition header
             cd = response.headers.get("Content-Disposition", "")
@@ -98,13 +144,13 @@ class LinkScraper:
                 return None
             
             # Extract filename="..."
-            filename_match = re.search(r'filename="([^"]+)"', cd)
+            filename_match = _CD_FILENAME_RE.search(cd)
             if filename_match:
                 return filename_match.group(1)
             
             return None
         except Exception as e:
-            print(f"Error getting Google Drive video filename for {view_url}: {e}")
+            logger.warning("Error getting Google Drive video filename for %s: %s", view_url, e)
             return None
 
     @staticmethod
@@ -113,126 +159,58 @@ class LinkScraper:
         try:
             filename = LinkScraper._get_google_drive_filename(url)
             if filename:
-                video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v']
-                if any(filename.lower().endswith(ext) for ext in video_extensions):
-                    print(f"DEBUG: Found Google Drive video: {url} -> {filename}")
+                if filename.lower().endswith(_VIDEO_EXT_SUFFIXES):
+                    logger.debug("Found Google Drive video: %s -> %s", url, filename)
                     return True
             return False
         except Exception as e:
-            print(f"Error checking Google Drive video for {url}: {e}")
+            logger.warning("Error checking Google Drive video for %s: %s", url, e)
             return False
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_youtube_link(url: str) -> bool:
         """Check if a URL is a YouTube video link."""
-        youtube_patterns = [
-            r'youtube\.com/watch\?v=',
-            r'youtu\.be/',
-            r'm\.youtube\.com/watch\?v=',
-            r'youtube\.com/embed/',
-            r'youtube\.com/v/'
-        ]
-        return any(re.search(pattern, url.lower()) for pattern in youtube_patterns)
+        return _YOUTUBE_RE.search(url.lower()) is not None
     
     @staticmethod
     def _is_zoom_recording(url: str) -> bool:
-        zoom_patterns = [
-            r"zoom\.us/rec/share/",
-            r"zoom\.us/rec/play/",
-            r"zoom\.us/rec/download/",
-        ]
-        return any(re.search(p, url) for p in zoom_patterns)
-
-    @staticmethod
-    def _check_video_redirect(url: str) -> Optional[str]:
-        """Check if a URL redirects to a video and return the final video URL."""
-        try:
-            print(f"DEBUG: Checking video redirect for: {url}")
-            response = requests.head(url, allow_redirects=True, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            print(f"DEBUG: Response status: {response.status_code}, final URL: {response.url}")
-            
-            # Check if the final URL ends with video extension
-            final_url = response.url
-            video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v']
-            if any(final_url.lower().endswith(ext) for ext in video_extensions):
-                print(f"DEBUG: Found video redirect: {url} -> {final_url}")
-                return final_url
-                
-            return None
-        except Exception as e:
-            print(f"DEBUG: Error checking video redirect for {url}: {e}")
-            return None
-    
-    @staticmethod
-    def _check_content_type_is_video(url: str) -> bool:
-        """Check if the content type of a URL is video."""
-        try:
-            response = requests.head(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            content_type = response.headers.get('content-type', '').lower()
-            video_types = [
-                'video/mp4', 'video/quicktime', 'video/x-msvideo', 'video/x-ms-wmv',
-                'video/x-flv', 'video/webm', 'video/x-matroska', 'video/mpeg',
-                'video/3gpp', 'video/x-m4v'
-            ]
-            return any(vt in content_type for vt in video_types)
-        except Exception as e:
-            print(f"Error checking video content type for {url}: {e}")
-            return False
+        return _ZOOM_RECORDING_RE.search(url) is not None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _get_youtube_title(video_url: str) -> Optional[str]:
         """Fetch YouTube video title using oEmbed API."""
         try:
             # Use YouTube's oEmbed API to get video metadata
             oembed_url = f"https://www.youtube.com/oembed?url={video_url}&format=json"
-            response = requests.get(oembed_url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
+            response = _get_sessions()[0].get(oembed_url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
                 title = data.get('title', '')
-                print(f"DEBUG: Fetched YouTube title: {video_url} -> {title}")
+                logger.debug("Fetched YouTube title: %s -> %s", video_url, title)
                 return title
             else:
-                print(f"DEBUG: Failed to fetch YouTube title for {video_url}: HTTP {response.status_code}")
+                logger.debug("Failed to fetch YouTube title for %s: HTTP %s", video_url, response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"DEBUG: Error fetching YouTube title for {video_url}: {e}")
+            logger.debug("Error fetching YouTube title for %s: %s", video_url, e)
             return None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _determine_document_type(text: str) -> str:
         """Determine if PDF is title based on text content."""
         if not text:
             return "unknown"
         
+        # Minutes win over agenda, and agenda over packet, wherever each appears in the text
         text_lower = text.lower()
-        
-        # Check for minutes keywords
-        minutes_keywords = ['minutes', 'minute', 'meeting minutes', 'meeting minute']
-        for keyword in minutes_keywords:
-            if keyword in text_lower:
-                return "minutes"
-        
-        # Check for agenda keywords
-        agenda_keywords = ['agenda', 'agendas']
-        for keyword in agenda_keywords:
+        for keyword, document_type in _DOCTYPE_KEYWORDS:
             if keyword in text_lower:
-                return "agenda"
-        
-        # Check for packet keywords
-        packet_keywords = ['packet', 'packets']
-        for keyword in packet_keywords:
-            if keyword in text_lower:
-                return "packet"
+                return document_type
         
         # Default to unknown if no specific keywords found
         return "unknown"
@@ -253,7 +231,7 @@ class LinkScraper:
             filename_lower = filename_lower.replace(suffix, '')
         
         # Clean up multiple hyphens and spaces
-        filename_lower = re.sub(r'-+', '-', filename_lower)
+        filename_lower = _HYPHENS_RE.sub('-', filename_lower)
         filename_lower = filename_lower.strip('-')
         
         return filename_lower
@@ -265,10 +243,10 @@ class LinkScraper:
         filename_lower = filename.lower()
         
         # Remove file extension
-        filename_lower = re.sub(r'\.pdf$', '', filename_lower)
+        filename_lower = _PDF_EXT_RE.sub('', filename_lower)
         
         # Remove date patterns (MM-DD-YY, MM-DD-YYYY, etc.)
-        filename_lower = re.sub(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', '', filename_lower)
+        filename_lower = _FILENAME_DATE_RE.sub('', filename_lower)
         
         # Remove document type keywords
         for keyword in ['agenda', 'minutes', 'minute']:
@@ -280,7 +258,7 @@ class LinkScraper:
             filename_lower = filename_lower.replace(suffix, '')
         
         # Clean up multiple hyphens and spaces
-        filename_lower = re.sub(r'-+', '-', filename_lower)
+        filename_lower = _HYPHENS_RE.sub('-', filename_lower)
         filename_lower = filename_lower.strip('-')
         filename_lower = filename_lower.strip()
         
@@ -288,60 +266,43 @@ class LinkScraper:
     
     @staticmethod
     def _longest_common_substring(s1: str, s2: str) -> str:
-        """Calculate longest common substring between two strings using dynamic programming."""
+        """Calculate longest common substring between two strings (at least 8 characters long)."""
         if not s1 or not s2:
             return ""
         
-        m, n = len(s1), len(s2)
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        # Variables to track longest substring
-        max_length = 0
-        end_pos_s1 = 0
-        
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                    if dp[i][j] > max_length:
-                        max_length = dp[i][j]
-                        end_pos_s1 = i
-                else:
-                    dp[i][j] = 0
+        # SequenceMatcher (pure Python) indexes where each character occurs in s2 and only extends runs
+        # at those positions, instead of allocating and filling an (m+1)x(n+1) table; like the old DP
+        # loop it returns the earliest longest match in s1
+        match = SequenceMatcher(None, s1, s2, autojunk=False).find_longest_match(0, len(s1), 0, len(s2))
         
         # Extract longest common substring
-        if max_length >= 8:
-            return s1[end_pos_s1 - max_length:end_pos_s1]
+        if match.size >= 8:
+            return s1[match.a:match.a + match.size]
         else:
             return ""
     
     @staticmethod
     def _merge_meetings_by_date_and_matching(meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge meetings that belong to the same meeting based on date and longest common substring."""
-        print(f"DEBUG: _merge_meetings_by_date_and_lcs called with {len(meetings)} meetings")
+        logger.debug("_merge_meetings_by_date_and_lcs called with %s meetings", len(meetings))
         
         if not meetings:
-            print("DEBUG: No meetings provided, returning empty list")
+            logger.debug("No meetings provided, returning empty list")
             return []
         
         # Group meetings by date
-        meetings_by_date = {}
+        meetings_by_date = defaultdict(list)
         for meeting in meetings:
             date = meeting.get("date")
-            print(f"DEBUG: Processing meeting with date: {date}, keys: {list(meeting.keys())}")
             if date:
-                if date not in meetings_by_date:
-                    meetings_by_date[date] = []
                 meetings_by_date[date].append(meeting)
         
-        print(f"DEBUG: Grouped meetings by date: {list(meetings_by_date.keys())}")
+        logger.debug("Grouped meetings by date: %s", list(meetings_by_date))
         
         merged_meetings = []
         
         for date, date_meetings in meetings_by_date.items():
-            print(f"DEBUG: Processing {len(date_meetings)} meetings for date {date}")
+            logger.debug("Processing %s meetings for date %s", len(date_meetings), date)
             
             # For this specific site, all meetings on the same date should be merged
             # since they follow the pattern YYYY-MM-DD_[doctype]_[number].pdf
@@ -354,11 +315,11 @@ class LinkScraper:
             titles = []
             
             for meeting in date_meetings:
-                print(f"DEBUG: Merging meeting: {meeting}")
+                logger.debug("Merging meeting: %s", meeting)
                 
                 # Add document types and URLs
                 for key, value in meeting.items():
-                    if key in ['agenda', 'minutes', 'packet', 'unknown', 'video'] and isinstance(value, str) and (value.endswith('.pdf') or value.endswith('.mp4') or value.endswith('.avi') or value.endswith('.mov') or value.endswith('.wmv') or value.endswith('.flv') or value.endswith('.webm') or value.endswith('.mkv') or value.endswith('.m4v')):
+                    if key in _MEDIA_KEYS and isinstance(value, str) and value.endswith(_MEDIA_EXT_SUFFIXES):
                         if key not in merged_meeting:
                             merged_meeting[key] = value
                     elif key == 'title' and value:
@@ -371,205 +332,279 @@ class LinkScraper:
                 unique_titles = list(dict.fromkeys(titles))  # Remove duplicates while preserving order
                 merged_meeting['title'] = ', '.join(unique_titles)
             
-            print(f"DEBUG: Created merged meeting: {merged_meeting}")
+            logger.debug("Created merged meeting: %s", merged_meeting)
             merged_meetings.append(merged_meeting)
         
         return merged_meetings
     
     @staticmethod
-    def _extract_pdf_data(html_content: str, base_url: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-        """Extract meeting data from PDF links using BeautifulSoup."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _is_plain_html_page(url: str) -> bool:
+        """Check if a URL is an ordinary web page (e.g. /meetings.html) rather than a possible document link.
+        
+        URLs with a query string are never skipped, since handlers like ViewFile.aspx?id=
+        or MetaViewer.php?clip_id= commonly serve or redirect to PDFs.
+        """
+        parts = urlsplit(url)
+        return not parts.query and parts.path.lower().endswith(_HTML_PAGE_SUFFIXES)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_link(url: str) -> Tuple[str, Optional[str]]:
+        """Classify a URL as "pdf", "video" or "none" from a single HEAD request.
+        
+        Returns the kind and, when the URL redirects to a PDF or video file, the final URL.
+        """
+        try:
+            logger.debug("Classifying link: %s", url)
+            response = _get_sessions()[0].head(url, allow_redirects=True, timeout=10)
+            
+            logger.debug("Response status: %s, final URL: %s", response.status_code, response.url)
+            
+            # The final URL's extension decides first, then the content type
+            final_url = response.url
+            final_url_lower = final_url.lower()
+            if final_url_lower.endswith('.pdf'):
+                return "pdf", final_url
+            if final_url_lower.endswith(_VIDEO_EXT_SUFFIXES):
+                return "video", final_url
+            
+            content_type = response.headers.get('content-type', '').lower()
+            if 'application/pdf' in content_type:
+                return "pdf", None
+            if content_type.split(';', 1)[0].strip() in _VIDEO_CONTENT_TYPES:
+                return "video", None
+            return "none", None
+        except Exception as e:
+            logger.debug("Error classifying link %s: %s", url, e)
+            return "none", None
+    
+    @staticmethod
+    def _extract_pdf_data(html_content: str, base_url: str, start_date: str, end_date: str,
+                          tree: Optional[lxml.html.HtmlElement] = None) -> List[Dict[str, Any]]:
+        """Extract meeting data from PDF links, reading the links from the lxml tree."""
         meetings = []
         
-        # Find all links - not just PDF links
-        all_links = soup.find_all('a', href=True)
+        # Find all links - not just PDF links - as (href, text) pairs
+        all_links = utils.extract_links(html_content, tree)
+        
+        logger.debug("Found %s total links", len(all_links))
         
-        print(f"DEBUG: Found {len(all_links)} total links")
+        # Bind the helpers used per link to locals once; the filter loop runs for every <a> on the page
+        parse_date = LinkScraper._parse_date
+        is_youtube_link = LinkScraper._is_youtube_link
+        normalize_url = LinkScraper._normalize_url
+        is_date_in_range = LinkScraper._is_date_in_range
         
         # Filter links first to avoid checking every single link
         # Look for links that might be meeting-related or already PDFs/videos
         potentially_media_links = []
+        add_candidate = potentially_media_links.append
         
-        for link in all_links:
-            href = link.get('href')
+        for href, link_text in all_links:
             if not href:
                 continue
-            link_text = link.get_text(strip=True)
             href_lower = href.lower()
             
             # Include if already PDF or video
-            video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v']
-            if href_lower.endswith('.pdf') or any(href_lower.endswith(ext) for ext in video_extensions):
-                potentially_media_links.append(link)
+            if href_lower.endswith(_MEDIA_EXT_SUFFIXES):
+                add_candidate((href, link_text))
                 continue
             
             # Include if YouTube link
-            if LinkScraper._is_youtube_link(href):
-                potentially_media_links.append(link)
+            if is_youtube_link(href):
+                add_candidate((href, link_text))
                 continue
             
             # Include if Google Drive link
             if 'drive.google.com' in href_lower:
-                potentially_media_links.append(link)
+                add_candidate((href, link_text))
                 continue
             
             # Include if text contains date data
-            if LinkScraper._parse_date(link_text):
-                potentially_media_links.append(link)
+            if parse_date(link_text):
+                add_candidate((href, link_text))
                 continue
                 
             # Include if href contains date data
-            if LinkScraper._parse_date(href):
-                potentially_media_links.append(link)
-        
-        print(f"DEBUG: Filtered to {len(potentially_media_links)} potentially media links")
+            if parse_date(href):
+                add_candidate((href, link_text))
+        
+        logger.debug("Filtered to %s potentially media links", len(potentially_media_links))
+        
+        # Resolve each link's absolute URL and sort it by how it is recognised, once per link:
+        # "direct" (PDF/video suffix), "zoom", "youtube", "drive", "page" (plain HTML page) or "check"
+        candidate_links = []
+        urls_to_probe = []
+        drive_urls = []
+        seen_links = set()
+        for href, link_text in potentially_media_links:
+            media_url = normalize_url(href, base_url)
+            
+            # Repeated anchors (same URL and text) would only produce duplicate meetings
+            if (media_url, link_text) in seen_links:
+                continue
+            seen_links.add((media_url, link_text))
+            
+            # A date in the link text decides the meeting date, so links already out of range
+            # need no network checks
+            text_date = parse_date(link_text)
+            if text_date and not is_date_in_range(text_date, start_date, end_date):
+                continue
+            
+            media_url_lower = media_url.lower()
+            
+            if media_url_lower.endswith(_MEDIA_EXT_SUFFIXES):
+                source = "direct"
+            elif LinkScraper._is_zoom_recording(media_url):
+                source = "zoom"
+            elif is_youtube_link(media_url):
+                source = "youtube"
+            elif 'drive.google.com' in media_url_lower:
+                source = "drive"
+            elif LinkScraper._is_plain_html_page(media_url):
+                source = "page"
+                logger.debug("Skipping link check for HTML page: %s", media_url)
+            else:
+                source = "check"
+            
+            # Otherwise the filename date comes next; only links that may redirect can still change it
+            if not text_date and source != "check":
+                filename_date = parse_date(media_url.rpartition('/')[2])
+                if filename_date and not is_date_in_range(filename_date, start_date, end_date):
+                    continue
+            
+            if source == "drive":
+                drive_urls.append(media_url)
+            elif source == "check":
+                urls_to_probe.append(media_url)
+            candidate_links.append((href, link_text, media_url, source))
+        
+        # Classify all unique URLs (one HEAD request each) and look up Google Drive
+        # filenames (one GET each) concurrently on the pooled session
+        urls_to_probe = list(dict.fromkeys(urls_to_probe))
+        drive_urls = list(dict.fromkeys(drive_urls))
+        link_kinds = {}
+        drive_filenames = {}
+        if urls_to_probe or drive_urls:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_CHECKS) as executor:
+                drive_lookups = executor.map(LinkScraper._get_google_drive_filename, drive_urls)
+                link_kinds = dict(zip(urls_to_probe, executor.map(LinkScraper._classify_link, urls_to_probe)))
+                drive_filenames = dict(zip(drive_urls, drive_lookups))
         
         valid_media_links = []
-        redirect_cache = {}  # Cache to avoid duplicate requests
+        redirect_cache = {}  # Final media URL for links that redirect to a PDF or video
         google_drive_filenames = {}  # Cache Google Drive filenames for date extraction
         google_drive_video_filenames = {}  # Cache Google Drive video filenames
         youtube_titles = {}  # Cache YouTube titles for date extraction
         
-        for link in potentially_media_links:
-            href = link.get('href')
-            if not href:
-                continue
-            
-            link_text = link.get_text(strip=True)
-            print(f"DEBUG: Checking filtered link - href: {href}, text: {link_text}")
-                
-            media_url = LinkScraper._normalize_url(href, base_url)
+        for link in candidate_links:
+            href, link_text, media_url, source = link
+            logger.debug("Checking filtered link - href: %s, text: %s", href, link_text)
             
-            # Check if it's already a PDF or video
-            video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v']
-            if media_url.lower().endswith('.pdf') or any(media_url.lower().endswith(ext) for ext in video_extensions):
-                valid_media_links.append(link)
-                continue
-            # Check if it's a Zoom recording link
-            if LinkScraper._is_zoom_recording(media_url):
-                valid_media_links.append(link)
-
-            # Check if it's a YouTube link
-            if LinkScraper._is_youtube_link(media_url):
+            # Direct PDFs/videos, Zoom recordings and YouTube links need no checks
+            if source in ("direct", "zoom", "youtube"):
                 valid_media_links.append(link)
                 continue
             
             # Check if it's a Google Drive link
-            if 'drive.google.com' in media_url.lower():
-                # Check for PDF
-                filename = LinkScraper._get_google_drive_filename(media_url)
-                if filename and filename.lower().endswith('.pdf'):
+            if source == "drive":
+                # One filename lookup decides between PDF and video
+                filename = drive_filenames[media_url]
+                filename_lower = filename.lower() if filename else ''
+                if filename_lower.endswith('.pdf'):
                     google_drive_filenames[media_url] = filename
-                    print(f"DEBUG: Found Google Drive PDF: {media_url} -> {filename}")
+                    logger.debug("Found Google Drive PDF: %s -> %s", media_url, filename)
                     valid_media_links.append(link)
-                    continue
-                
-                # Check for video
-                video_filename = LinkScraper._get_google_drive_filename(media_url)
-                if video_filename and any(video_filename.lower().endswith(ext) for ext in video_extensions):
-                    google_drive_video_filenames[media_url] = video_filename
-                    print(f"DEBUG: Found Google Drive video: {media_url} -> {video_filename}")
+                elif filename_lower.endswith(_VIDEO_EXT_SUFFIXES):
+                    google_drive_video_filenames[media_url] = filename
+                    logger.debug("Found Google Drive video: %s -> %s", media_url, filename)
                     valid_media_links.append(link)
-                    continue
                 continue
             
-            # Use cache to avoid duplicate requests
-            if media_url in redirect_cache:
-                if redirect_cache[media_url]:
-                    valid_media_links.append(link)
-                    continue
-            
-            # If not a direct media file, try to check if it redirects to PDF or video
-            redirect_pdf_url = LinkScraper._check_pdf_redirect(media_url)
-            redirect_video_url = LinkScraper._check_video_redirect(media_url)
-            
-            if redirect_pdf_url or redirect_video_url:
-                final_url = redirect_pdf_url or redirect_video_url
-                redirect_cache[media_url] = final_url
-                print(f"DEBUG: Found redirect to media: {media_url} -> {final_url}")
+            kind, redirect_url = link_kinds.get(media_url, ("none", None))
+            if redirect_url:
+                redirect_cache[media_url] = redirect_url
+                logger.debug("Found redirect to %s: %s -> %s", kind, media_url, redirect_url)
                 valid_media_links.append(link)
-                continue
-            
-            # If no redirect, check if content type is PDF or video
-            if LinkScraper._check_content_type_is_pdf(media_url) or LinkScraper._check_content_type_is_video(media_url):
-                print(f"DEBUG: Found media by content type: {media_url}")
+            elif kind != "none":
+                logger.debug("Found %s by content type: %s", kind, media_url)
                 valid_media_links.append(link)
         
-        print(f"DEBUG: Found {len(valid_media_links)} valid media links")
-        for i, link in enumerate(valid_media_links[:5]):  # Show first 5 for debugging
-            print(f"DEBUG: Media {i+1}: href={link.get('href')}, text={link.get_text(strip=True)}")
+        logger.debug("Found %s valid media links", len(valid_media_links))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, (href, link_text, _, _) in enumerate(valid_media_links[:5]):  # Show first 5 for debugging
+                logger.debug("Media %s: href=%s, text=%s", i+1, href, link_text)
         
         if not valid_media_links:
             return None
         
-        for link in valid_media_links:
+        # Fetch the titles of YouTube links whose text and URL carry no date concurrently, up front
+        youtube_urls_to_fetch = list(dict.fromkeys(
+            media_url for _, link_text, media_url, source in valid_media_links
+            if source == "youtube" and not parse_date(link_text)
+            and not parse_date(media_url.rpartition('/')[2])
+        ))
+        if youtube_urls_to_fetch:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_CHECKS) as executor:
+                youtube_titles.update(zip(youtube_urls_to_fetch,
+                                          executor.map(LinkScraper._get_youtube_title, youtube_urls_to_fetch)))
+        
+        for href, link_text, media_url, source in valid_media_links:
             meeting = {}
             meeting_date = None
             
-            # Get media URL
-            href = link.get('href')
-            if not href:
-                continue
-            
-            media_url = LinkScraper._normalize_url(href, base_url)
-            
-            # If not a direct media file, check for redirect again to get the final URL
-            video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v']
-            if not (media_url.lower().endswith('.pdf') or any(media_url.lower().endswith(ext) for ext in video_extensions)):
-                redirect_url = redirect_cache.get(media_url) or LinkScraper._check_pdf_redirect(media_url) or LinkScraper._check_video_redirect(media_url)
+            # If not a direct media file, use the final URL found by the redirect check
+            if source != "direct":
+                redirect_url = redirect_cache.get(media_url)
                 if redirect_url:
                     media_url = redirect_url
             
-            # Get text content for date and document type extraction
-            link_text = link.get_text(strip=True)
-            
             # Try to extract date from link text first
-            parsed_date = LinkScraper._parse_date(link_text)
+            parsed_date = parse_date(link_text)
             if parsed_date:
                 meeting_date = parsed_date
             
             # Also try to extract date from filename
             if not meeting_date:
-                filename = media_url.split('/')[-1]
-                filename_date = LinkScraper._parse_date(filename)
+                filename = media_url.rpartition('/')[2]
+                filename_date = parse_date(filename)
                 if filename_date:
                     meeting_date = filename_date
             
             # For Google Drive links, try to extract date from the actual filename
             if not meeting_date and media_url in google_drive_filenames:
                 gd_filename = google_drive_filenames[media_url]
-                gd_filename_date = LinkScraper._parse_date(gd_filename)
+                gd_filename_date = parse_date(gd_filename)
                 if gd_filename_date:
                     meeting_date = gd_filename_date
-                    print(f"DEBUG: Extracted date from Google Drive filename: {gd_filename} -> {gd_filename_date}")
+                    logger.debug("Extracted date from Google Drive filename: %s -> %s", gd_filename, gd_filename_date)
             
             # For Google Drive video links, try to extract date from the video filename
             if not meeting_date and media_url in google_drive_video_filenames:
                 gd_video_filename = google_drive_video_filenames[media_url]
-                gd_video_filename_date = LinkScraper._parse_date(gd_video_filename)
+                gd_video_filename_date = parse_date(gd_video_filename)
                 if gd_video_filename_date:
                     meeting_date = gd_video_filename_date
-                    print(f"DEBUG: Extracted date from Google Drive video filename: {gd_video_filename} -> {gd_video_filename_date}")
+                    logger.debug("Extracted date from Google Drive video filename: %s -> %s", gd_video_filename, gd_video_filename_date)
             
             # For YouTube links, try to extract date from the video title
-            if not meeting_date and LinkScraper._is_youtube_link(media_url):
+            if not meeting_date and is_youtube_link(media_url):
                 if media_url not in youtube_titles:
                     youtube_title = LinkScraper._get_youtube_title(media_url)
                     youtube_titles[media_url] = youtube_title
                 
                 youtube_title = youtube_titles[media_url]
                 if youtube_title:
-                    youtube_title_date = LinkScraper._parse_date(youtube_title)
+                    youtube_title_date = parse_date(youtube_title)
                     if youtube_title_date:
                         meeting_date = youtube_title_date
-                        print(f"DEBUG: Extracted date from YouTube title: {youtube_title} -> {youtube_title_date}")
+                        logger.debug("Extracted date from YouTube title: %s -> %s", youtube_title, youtube_title_date)
             
             # Determine document type
             document_type = LinkScraper._determine_document_type(link_text)
             
             # Check if it's a video file and update document type accordingly
-            if any(media_url.lower().endswith(ext) for ext in video_extensions) or LinkScraper._is_youtube_link(media_url) or media_url in google_drive_video_filenames:
+            if media_url.lower().endswith(_VIDEO_EXT_SUFFIXES) or is_youtube_link(media_url) or media_url in google_drive_video_filenames:
                 document_type = "video"
             
             # If date extraction successful and date is within range
@@ -582,9 +617,9 @@ class LinkScraper:
                     meeting["title"] = link_text
                 
                 meetings.append(meeting)
-                print(f"DEBUG: Added meeting: {meeting}")
+                logger.debug("Added meeting: %s", meeting)
         
-        # print(f"DEBUG: Total meetings found: {len(meetings)}")
+        # logger.debug("Total meetings found: %s", len(meetings))
         
         # Merge meetings that belong to the same meeting using LCS
         merged_meetings = LinkScraper._merge_meetings_by_date_and_matching(meetings)
@@ -592,7 +627,8 @@ class LinkScraper:
         return merged_meetings if merged_meetings else None
     
     @staticmethod
-    def try_scrape(html_content: str, url: str, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+    def try_scrape(html_content: str, url: str, start_date: str, end_date: str,
+                   tree: Optional[lxml.html.HtmlElement] = None) -> Optional[List[Dict[str, Any]]]:
         """Try to scrape meeting data by collecting meeting agendas and minutes from PDF files.
         
         Args:
@@ -600,6 +636,7 @@ class LinkScraper:
             url: The URL that was scraped
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            tree: html_content already parsed by utils.parse_html, shared with other scrapers
             
         Returns:
             Meeting data if successful, None if unsuccessful
@@ -609,7 +646,7 @@ class LinkScraper:
                 return None
             
             # Extract PDF data with date filtering
-            meetings = LinkScraper._extract_pdf_data(html_content, url, start_date, end_date)
+            meetings = LinkScraper._extract_pdf_data(html_content, url, start_date, end_date, tree)
             
             if meetings is None:
                 return None
@@ -617,5 +654,5 @@ class LinkScraper:
             return meetings
             
         except Exception as e:
-            print(f"Error in LinkScraper for {url}: {e}")
+            logger.warning("Error in LinkScraper for %s: %s", url, e)
             return None
\ No newline at end of file
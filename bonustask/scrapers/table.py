@@ -1,11 +1,61 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 from token import EQUAL
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
 from typing import Dict, Any, List, Optional
+import lxml.html
 from . import utils
 
+# Links that mark a row as a meeting: agenda PDF handlers and .pdf files
+_PDF_LINK_RE = re.compile(r'DisplayAgendaPDF\.ashx\?MeetingID=|\.pdf$', re.IGNORECASE)
+
+# Runs of whitespace collapsed to a single space in cell text
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Values that count as media data: URLs and paths, or names of document and media files
+_MEDIA_URL_PREFIXES = ('http://', 'https://', '/')
+_MEDIA_FILE_SUFFIXES = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.mp3', '.mp4', '.wav')
+
+# Cell keywords and the standard key each maps to, in order of priority
+_KEY_MAPPINGS = [
+    # Agenda keywords
+    (['agenda'], 'agenda'),
+    # Minutes keywords  
+    (['minutes'], 'minutes'),
+    # Recording/video keywords
+    (['recording', 'video', 'audio'], 'recording'),
+    # Packet/document keywords
+    (['packet', 'agenda packet', 'agenda-packet'], 'agenda_packet'),
+    # Notice keywords
+    (['notice', 'cancellation', 'cancelled'], 'notice'),
+    # Special meeting keywords
+    (['special meeting', 'special'], 'special_meeting'),
+    # Regular meeting keywords
+    (['regular meeting', 'regular'], 'regular_meeting'),
+    # Workshop keywords
+    (['workshop', 'community workshop'], 'workshop'),
+    # Town hall keywords
+    (['town hall', 'community meet and greet'], 'town_hall'),
+    # Correspondence keywords
+    (['correspondence', 'non-agenda'], 'correspondence'),
+    # Attachment keywords
+    (['attachment', 'exhibit', 'appendix'], 'attachment'),
+    # Material keywords
+    (['material', 'updated material', 'additional material'], 'material'),
+    # Presentation keywords
+    (['presentation', 'powerpoint'], 'presentation'),
+    # Report keywords
+    (['report', 'staff report'], 'report'),
+    # Plan keywords
+    (['plan', 'project plan'], 'plan'),
+    # Other common meeting items
+    (['summary', 'addendum', 'update'], 'other'),
+]
+
+# The same keywords flattened into (keyword, standard key) pairs, keeping the priority order
+_KEY_KEYWORDS = tuple((keyword, standard_key) for keywords, standard_key in _KEY_MAPPINGS for keyword in keywords)
+
 class TableScraper:
     @staticmethod
     def _normalize_url(url: str, base_url: str) -> str:
@@ -13,11 +63,13 @@ class TableScraper:
         return utils.normalize_url(url, base_url)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_date(date_str: str) -> Optional[str]:
         """Parse date string in various formats and return YYYY-MM-DD format."""
         return utils.parse_date(date_str)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_date_in_range(meeting_date: str, start_date: str, end_date: str) -> bool:
         """Check if meeting date is within the specified range."""
         if not meeting_date:
@@ -37,13 +89,14 @@ class TableScraper:
         """Check if meeting has at least one media data (non-empty value that's a URL or file)."""
         for key, value in meeting.items():
             if value and isinstance(value, str):
-                # Check if it's a URL or file path (contains .pdf, .doc, etc.)
-                if (value.startswith(('http://', 'https://', '/')) or 
-                    any(value.lower().endswith(ext) for ext in ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.mp3', '.mp4', '.wav'])):
+                # Check if it's a URL or file path (contains .pdf, .doc, etc.). Lowercasing the short cell
+                # value is cheaper than a case-insensitive regex search, which tries every position.
+                if value.startswith(_MEDIA_URL_PREFIXES) or value.lower().endswith(_MEDIA_FILE_SUFFIXES):
                     return True
         return False
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_key(cell_text: str) -> str:
         """Normalize cell text to standard key from predefined keywords."""
         if not cell_text:
@@ -52,47 +105,10 @@ class TableScraper:
         # Convert to lowercase for case-insensitive matching
         text_lower = cell_text.lower()
         
-        # Define keyword mappings in order of priority
-        keyword_mappings = [
-            # Agenda keywords
-            (['agenda'], 'agenda'),
-            # Minutes keywords  
-            (['minutes'], 'minutes'),
-            # Recording/video keywords
-            (['recording', 'video', 'audio'], 'recording'),
-            # Packet/document keywords
-            (['packet', 'agenda packet', 'agenda-packet'], 'agenda_packet'),
-            # Notice keywords
-            (['notice', 'cancellation', 'cancelled'], 'notice'),
-            # Special meeting keywords
-            (['special meeting', 'special'], 'special_meeting'),
-            # Regular meeting keywords
-            (['regular meeting', 'regular'], 'regular_meeting'),
-            # Workshop keywords
-            (['workshop', 'community workshop'], 'workshop'),
-            # Town hall keywords
-            (['town hall', 'community meet and greet'], 'town_hall'),
-            # Correspondence keywords
-            (['correspondence', 'non-agenda'], 'correspondence'),
-            # Attachment keywords
-            (['attachment', 'exhibit', 'appendix'], 'attachment'),
-            # Material keywords
-            (['material', 'updated material', 'additional material'], 'material'),
-            # Presentation keywords
-            (['presentation', 'powerpoint'], 'presentation'),
-            # Report keywords
-            (['report', 'staff report'], 'report'),
-            # Plan keywords
-            (['plan', 'project plan'], 'plan'),
-            # Other common meeting items
-            (['summary', 'addendum', 'update'], 'other'),
-        ]
-        
         # Check for keyword matches
-        for keywords, standard_key in keyword_mappings:
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return standard_key
+        for keyword, standard_key in _KEY_KEYWORDS:
+            if keyword in text_lower:
+                return standard_key
         
         if "youtube.com/watch?v=" in text_lower:
             return "youtube"
@@ -113,9 +129,12 @@ class TableScraper:
             meeting[new_key] = value
     
     @staticmethod
-    def _extract_table_data(html_content: str, base_url: str, start_date: str, end_date: str, debug_log=None) -> List[Dict[str, Any]]:
-        """Extract meeting data from table rows using BeautifulSoup."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _extract_table_data(html_content: str, base_url: str, start_date: str, end_date: str, debug_log=None,
+                            tree: Optional[lxml.html.HtmlElement] = None) -> List[Dict[str, Any]]:
+        """Extract meeting data from table rows using lxml."""
+        if tree is None:
+            tree = utils.parse_html(html_content)
+        element_text = utils.element_text
         meetings = []
         
         def debug_log_write(message):
@@ -134,13 +153,13 @@ class TableScraper:
             debug_log_write(f"Processing table body at depth {depth}")
             
             # Find all <tr> elements in this table body
-            tr_elements = table_body.find_all('tr')
+            tr_elements = list(table_body.iter('tr'))
             debug_log_write(f"Found {len(tr_elements)} <tr> elements at depth {depth}")
             
             for tr_idx, tr in enumerate(tr_elements):
                 # Check if this <tr> contains another table body
-                nested_table_body = tr.find('tbody')
-                if nested_table_body:
+                nested_table_body = tr.find('.//tbody')
+                if nested_table_body is not None:
                     debug_log_write(f"<tr> {tr_idx} contains nested table body, recursing into it")
                     # Recursively process the nested table body
                     nested_meetings = process_table_body(nested_table_body, depth + 1)
@@ -148,9 +167,9 @@ class TableScraper:
                     continue
                 
                 # Filter out pagination/navigation rows before processing
-                cells = tr.find_all(['td', 'th'])
+                cells = list(tr.iter('td', 'th'))
                 if cells:
-                    cell_texts = [cell.get_text(strip=True) for cell in cells]
+                    cell_texts = [element_text(cell) for cell in cells]
                     
                     # Skip rows with only navigation symbols or single digits
                     nav_symbols = ['<<', '>>', '<', '>', '...', 'select']
@@ -164,7 +183,8 @@ class TableScraper:
                     # Check if this row has meeting-related content
                     has_date = any(TableScraper._parse_date(text) for text in cell_texts)
                     has_meeting_keywords = any(keyword in ' '.join(cell_texts).lower() for keyword in ['regular', 'session', 'meeting', 'council', 'workshop'])
-                    has_pdf_links = any(cell.find('a', href=re.compile(r'DisplayAgendaPDF\.ashx\?MeetingID=|\.pdf$', re.IGNORECASE)) for cell in cells)
+                    has_pdf_links = any(_PDF_LINK_RE.search(link.get('href'))
+                                        for cell in cells for link in cell.iter('a') if link.get('href') is not None)
                     
                     # Only process rows that look like actual meetings
                     if not (has_date or has_meeting_keywords or has_pdf_links):
@@ -177,7 +197,7 @@ class TableScraper:
                 key_counts = {}  # Track key occurrences for suffix handling
                 
                 # Find all cells in the row (td and th)
-                cells = tr.find_all(['td', 'th'])
+                cells = list(tr.iter('td', 'th'))
                 
                 if not cells:
                     continue
@@ -185,12 +205,12 @@ class TableScraper:
                 # Extract data from each cell
                 for cell in cells:
                     # Get cell text as key (cleaned)
-                    cell_text = cell.get_text(strip=True)
+                    cell_text = element_text(cell)
                     if not cell_text:
                         continue
                     
                     # Clean up cell text: remove newlines and extra whitespace
-                    cell_text = re.sub(r'\s+', ' ', cell_text).strip()
+                    cell_text = _WHITESPACE_RE.sub(' ', cell_text).strip()
                     
                     # Check if this cell contains date information
                     parsed_date = TableScraper._parse_date(cell_text)
@@ -203,14 +223,14 @@ class TableScraper:
                         
                         # Also store the original cell text as a key with the link as value
                         # This handles cases where "August 14, 2025" is both a date and a key
-                        links = cell.find_all('a')
+                        links = list(cell.iter('a'))
                         if links:
                             for i, link in enumerate(links):
                                 href = link.get('href')
                                 if href:
                                     normalized_url = TableScraper._normalize_url(href, base_url)
                                     # For multiple links, add index suffix after the key
-                                    link_text = link.get_text(strip=True)
+                                    link_text = element_text(link)
                                     link_key = TableScraper._normalize_key(link_text)
                                     TableScraper._add_unique_key(meeting, key_counts, link_key, normalized_url)
                     else:
@@ -218,7 +238,7 @@ class TableScraper:
                         key = TableScraper._normalize_key(cell_text)
                         
                         # Extract all links from this cell, including those in nested tables
-                        all_links = cell.find_all('a')
+                        all_links = list(cell.iter('a'))
                         
                         if all_links:
                             # Process all links found in this cell (including nested table links)
@@ -228,7 +248,7 @@ class TableScraper:
                                     # Normalize the URL
                                     normalized_url = TableScraper._normalize_url(href, base_url)
                                     # For multiple links, add index suffix after the key
-                                    link_text = link.get_text(strip=True)
+                                    link_text = element_text(link)
                                     link_key = TableScraper._normalize_key(link_text)
                                     TableScraper._add_unique_key(meeting, key_counts, link_key, normalized_url)
                         else:
@@ -270,7 +290,7 @@ class TableScraper:
             return local_meetings
         
         # Find all tables and debug the structure
-        all_tables = soup.find_all('table')
+        all_tables = list(tree.iter('table')) if tree is not None else []
         debug_log_write(f"Found {len(all_tables)} total tables")
         
         # Process each table
@@ -278,8 +298,8 @@ class TableScraper:
             debug_log_write(f"Processing table {table_idx}")
             
             # Find table body
-            table_body = table.find('tbody')
-            if not table_body:
+            table_body = table.find('.//tbody')
+            if table_body is None:
                 # If no tbody, use the table itself
                 table_body = table
                 debug_log_write(f"No tbody found in table {table_idx}, using table element")
@@ -294,7 +314,8 @@ class TableScraper:
         return meetings if meetings else None
     
     @staticmethod
-    def try_scrape(html_content: str, url: str, start_date: str, end_date: str, debug_log=None) -> Optional[List[Dict[str, Any]]]:
+    def try_scrape(html_content: str, url: str, start_date: str, end_date: str, debug_log=None,
+                   tree: Optional[lxml.html.HtmlElement] = None) -> Optional[List[Dict[str, Any]]]:
         """Try to scrape meeting data using table-based approach.
         
         Args:
@@ -302,6 +323,7 @@ class TableScraper:
             url: The URL that was scraped
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            tree: html_content already parsed by utils.parse_html, shared with other scrapers
             
         Returns:
             Meeting data if successful, None if unsuccessful
@@ -311,7 +333,7 @@ class TableScraper:
                 return None
             
             # Extract table data with date filtering and media validation
-            meetings = TableScraper._extract_table_data(html_content, url, start_date, end_date, debug_log)
+            meetings = TableScraper._extract_table_data(html_content, url, start_date, end_date, debug_log, tree)
             
             if meetings is None:
                 return None
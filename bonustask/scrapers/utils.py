@@ -1,7 +1,108 @@
 import re
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from typing import Optional
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+from typing import List, Optional, Tuple
+import lxml.html
+from lxml import etree
+
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_HIDDEN_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+
+def parse_html(html_content: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse HTML with lxml into a tree whose text reads like BeautifulSoup's.
+    
+    Returns None for empty documents and for ones lxml can't parse (e.g. comment-only bodies).
+    The tree can be shared by every scraper for the page.
+    """
+    if not html_content or not html_content.strip():
+        return None
+    
+    # Parse bytes so an XML encoding declaration in the markup doesn't make lxml reject the string.
+    # Lone surrogates can't be encoded; they become '?' so the rest of the page still parses.
+    try:
+        tree = lxml.html.document_fromstring(html_content.encode('utf-8', errors='replace'),
+                                             parser=lxml.html.HTMLParser(encoding='utf-8'))
+    except (etree.ParserError, ValueError):
+        return None
+    
+    # Blank hidden text in place rather than removing the elements, which would merge the
+    # text around them into one piece and change how get_text(strip=True) strips it
+    for container in tree.iter(*_HIDDEN_TEXT_TAGS):
+        container.text = None
+        for descendant in container.iterdescendants():
+            descendant.text = None
+            descendant.tail = None
+    return tree
+
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    """Return an element's text like BeautifulSoup's get_text(strip=True).
+    
+    Each text piece is stripped and the pieces are joined without separators, leaving out comments.
+    """
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def extract_links(html_content: str, tree: Optional[lxml.html.HtmlElement] = None) -> List[Tuple[str, str]]:
+    """Return (href, text) for every <a href> in the page, read straight from lxml's tree.
+    
+    The text matches BeautifulSoup's get_text(strip=True). Pass tree when the page was
+    already parsed with parse_html.
+    """
+    if tree is None:
+        tree = parse_html(html_content)
+        if tree is None:
+            return []
+    
+    return [
+        (link.get('href'), element_text(link))
+        for link in tree.iter('a')
+        if link.get('href') is not None
+    ]
+
+
+# Ordinal suffixes (1st, 2nd, 3rd, 4th) stripped before matching dates
+_ORDINAL_RE = re.compile(r'(\d+)(st|nd|rd|th)\b')
+
+_FULL_MONTHS = r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+
+# Date patterns in priority order, each tagged with the order of its (year, month, day) groups
+_DATE_PATTERNS = [
+    # Month DD, YYYY (full month names)
+    (re.compile(_FULL_MONTHS + r'\s*(\d{1,2}),?\s+(\d{4})'), 'month_name'),
+    # Abbreviated month names with or without periods (Jan., Jan, Aug., Aug, Sept., Sep)
+    (re.compile(r'(Jan\.?|Feb\.?|Mar\.?|Apr\.?|May|Jun\.?|Jul\.?|Aug\.?|Sep\.?|Sept\.?|Oct\.?|Nov\.?|Dec\.?)\s*(\d{1,2}),?\s+(\d{4})'), 'month_abbr'),
+    # DD Month YYYY
+    (re.compile(r'(\d{1,2})\s+' + _FULL_MONTHS + r'\s+(\d{4})'), 'day_month_name'),
+    # YYYY-MM-DD, YYYY/MM/DD
+    (re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})'), 'ymd'),
+    # MM/DD/YYYY, M/D/YYYY
+    (re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), 'mdy'),
+    # MM-DD-YY, M-D-YY (2-digit year)
+    (re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2})'), 'mdy'),
+    # MM.DD.YYYY, M.D.YYYY (dot separators)
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})'), 'mdy'),
+    # MM.DD.YY, M.D.YY (2-digit year with dots)
+    (re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2})'), 'mdy'),
+    # MMDDYY (6-digit without separators)
+    (re.compile(r'(\d{2})(\d{2})(\d{2})'), 'mdy'),
+]
+
+# Every supported format has at least four digits (M.D.YY is the shortest)
+_FOUR_DIGITS_RE = re.compile(r'\d(?:\D*\d){3}')
+
+# Capital letters that every month-name pattern needs; without any, only numeric formats can match
+_MONTH_INITIAL_RE = re.compile(r'[JFMASOND]')
+
+# The numeric patterns alone, in the same priority order, for strings that can't hold a month name
+_NUMERIC_DATE_PATTERNS = [(pattern, kind) for pattern, kind in _DATE_PATTERNS
+                          if kind not in ('month_name', 'month_abbr', 'day_month_name')]
+
+# All date patterns fused into one alternation, so strings without any date are rejected in a single scan
+_ANY_DATE_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern, _ in _DATE_PATTERNS))
 
 
 def parse_date(date_str: str) -> Optional[str]:
@@ -9,63 +110,60 @@ def parse_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
     
+    # Most cell and link texts ("Agenda", "Regular Meeting") have too few digits to hold a date
+    if not _FOUR_DIGITS_RE.search(date_str):
+        return None
+    
     # Preprocess: remove ordinal suffixes (st, nd, rd, th)
-    cleaned_date = re.sub(r'(\d+)(st|nd|rd|th)\b', r'\1', date_str)
+    cleaned_date = _ORDINAL_RE.sub(r'\1', date_str)
+    has_month_initial = _MONTH_INITIAL_RE.search(cleaned_date) is not None
     
-    # Common date patterns to match
-    patterns = [
-        # Month DD, YYYY (full month names)
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s*(\d{1,2}),?\s+(\d{4})',
-        # Abbreviated month names with or without periods (Jan., Jan, Aug., Aug, Sept., Sep)
-        r'(Jan\.?|Feb\.?|Mar\.?|Apr\.?|May|Jun\.?|Jul\.?|Aug\.?|Sep\.?|Sept\.?|Oct\.?|Nov\.?|Dec\.?)\s*(\d{1,2}),?\s+(\d{4})',
-        # DD Month YYYY
-        r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-        # YYYY-MM-DD, YYYY/MM/DD
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-        # MM/DD/YYYY, M/D/YYYY
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
-        # MM-DD-YY, M-D-YY (2-digit year)
-        r'(\d{1,2})[/-](\d{1,2})[/-](\d{2})',
-        # MM.DD.YYYY, M.D.YYYY (dot separators)
-        r'(\d{1,2})\.(\d{1,2})\.(\d{4})',
-        # MM.DD.YY, M.D.YY (2-digit year with dots)
-        r'(\d{1,2})\.(\d{1,2})\.(\d{2})',
-        # MMDDYY (6-digit without separators)
-        r'(\d{2})(\d{2})(\d{2})',
-    ]
+    # Fast path for strings that start with an ISO date (e.g. 2024-03-15_minutes.pdf). Month-name
+    # formats take priority over numeric ones, so it only applies when no month name can match.
+    if (len(cleaned_date) >= 10 and cleaned_date[4] == '-' and cleaned_date[7] == '-'
+            and cleaned_date[:4].isdigit() and cleaned_date[5:7].isdigit() and cleaned_date[8:10].isdigit()
+            and not has_month_initial):
+        try:
+            date_obj = datetime(int(cleaned_date[:4]), int(cleaned_date[5:7]), int(cleaned_date[8:10]))
+            return date_obj.strftime('%Y-%m-%d')
+        except ValueError:
+            pass  # Not a real date; let the patterns below decide
+    
+    # Most link texts and hrefs contain no date at all
+    if not _ANY_DATE_RE.search(cleaned_date):
+        return None
     
-    for pattern in patterns:
-        match = re.search(pattern, cleaned_date)
+    for pattern, kind in (_DATE_PATTERNS if has_month_initial else _NUMERIC_DATE_PATTERNS):
+        match = pattern.search(cleaned_date)
         if match:
             groups = match.groups()
             
             try:
-                if len(groups) == 3:
-                    # Determine the order based on pattern
-                    if pattern.startswith(r'(\d{4})'):  # YYYY-MM-DD format
-                        year, month, day = groups
-                    elif pattern.startswith(r'(January|February|March|April|May|June|July|August|September|October|November|December)'):  # Month DD, YYYY
-                        month_str, day, year = groups
-                        month = datetime.strptime(month_str[:3], '%b').month
-                    elif pattern.startswith(r'(Jan\.?|Feb\.?|Mar\.?|Apr\.?|May|Jun\.?|Jul\.?|Aug\.?|Sep\.?|Sept\.?|Oct\.?|Nov\.?|Dec\.?)'):  # Abbreviated month names
-                        month_str, day, year = groups
-                        # Remove period if present and parse abbreviated month
-                        month_str_clean = month_str.rstrip('.')
-                        month = datetime.strptime(month_str_clean[:3], '%b').month
-                    elif pattern.startswith(r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)'):  # DD Month YYYY
-                        day, month_str, year = groups
-                        month = datetime.strptime(month_str[:3], '%b').month
-                    else:  # MM/DD/YYYY or MM-DD-YY format
-                        month, day, year = groups
-                        
-                        # Handle 2-digit years (convert to 4-digit)
-                        if len(year) == 2:
-                            # Assume 20xx for years 00-99, could be made smarter
-                            year = '20' + year
+                # Determine the order based on pattern
+                if kind == 'ymd':  # YYYY-MM-DD format
+                    year, month, day = groups
+                elif kind == 'month_name':  # Month DD, YYYY
+                    month_str, day, year = groups
+                    month = datetime.strptime(month_str[:3], '%b').month
+                elif kind == 'month_abbr':  # Abbreviated month names
+                    month_str, day, year = groups
+                    # Remove period if present and parse abbreviated month
+                    month_str_clean = month_str.rstrip('.')
+                    month = datetime.strptime(month_str_clean[:3], '%b').month
+                elif kind == 'day_month_name':  # DD Month YYYY
+                    day, month_str, year = groups
+                    month = datetime.strptime(month_str[:3], '%b').month
+                else:  # MM/DD/YYYY or MM-DD-YY format
+                    month, day, year = groups
                     
-                    # Create date object and format
-                    date_obj = datetime(int(year), int(month), int(day))
-                    return date_obj.strftime('%Y-%m-%d')
+                    # Handle 2-digit years (convert to 4-digit)
+                    if len(year) == 2:
+                        # Assume 20xx for years 00-99, could be made smarter
+                        year = '20' + year
+                
+                # Create date object and format
+                date_obj = datetime(int(year), int(month), int(day))
+                return date_obj.strftime('%Y-%m-%d')
                     
             except (ValueError, AttributeError):
                 continue
@@ -73,19 +171,28 @@ def parse_date(date_str: str) -> Optional[str]:
     return None
 
 
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://')
+
+
+@lru_cache(maxsize=256)
+def _base_origin(base_url: str) -> str:
+    """Return scheme://netloc of a base URL, split once per page rather than per link."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
 def normalize_url(url: str, base_url: str) -> str:
     """Normalize URL - convert relative URLs to absolute."""
     if not url:
         return ""
     
     # If it's already an absolute URL, return as is
-    if url.startswith(('http://', 'https://')):
+    if url.startswith(_ABSOLUTE_URL_PREFIXES):
         return url
     
     # If it's a relative URL starting with /, combine with base URL origin
     if url.startswith('/'):
-        parsed_base = urlparse(base_url)
-        return f"{parsed_base.scheme}://{parsed_base.netloc}{url}"
+        return _base_origin(base_url) + url
     
     # Otherwise, use urljoin to handle relative paths
     return urljoin(base_url, url)
\ No newline at end of file
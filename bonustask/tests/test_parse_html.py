@@ -0,0 +1,29 @@
+import unittest
+
+from scrapers import utils
+from scrapers.link import LinkScraper
+from scrapers.table import TableScraper
+
+
+class ParseHtmlTest(unittest.TestCase):
+    def test_comment_only_page(self):
+        self.assertIsNone(utils.parse_html('<!-- only a comment -->'))
+
+    def test_xml_declaration_only_page(self):
+        self.assertIsNone(utils.parse_html('<?xml version="1.0" encoding="utf-8"?>'))
+
+    def test_lone_surrogate(self):
+        html_content = '<p>a\ud800b <a href="/minutes.pdf">Minutes</a></p>'
+        tree = utils.parse_html(html_content)
+        self.assertIsNotNone(tree)
+        self.assertEqual(utils.extract_links(html_content, tree), [('/minutes.pdf', 'Minutes')])
+
+    def test_scrapers_skip_comment_only_page(self):
+        html_content = '<!-- only a comment -->'
+        url = 'https://example.com/meetings'
+        self.assertIsNone(TableScraper.try_scrape(html_content, url, '2024-01-01', '2024-12-31'))
+        self.assertIsNone(LinkScraper.try_scrape(html_content, url, '2024-01-01', '2024-12-31'))
+
+
+if __name__ == '__main__':
+    unittest.main()